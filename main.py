@@ -1,7 +1,12 @@
+import logging
 import os
 from utils.gcp.gcs_helper import GCSClient
 import pandas as pd
 
+# Logging is configured here at the application entry point; library modules
+# only create named loggers.
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
 def main():
     # Create a sample DataFrame
     df = pd.DataFrame({
@@ -16,7 +21,7 @@ def main():
     bucket_name = os.getenv('GCS_BUCKET_NAME', 'prod-dp')
     prefix = os.getenv('GCS_PREFIX', 'data_test_check')
     file_name = os.getenv('GCS_FILE_NAME', 'canhld')
-    file_format = os.getenv('GCS_FILE_FORMAT', 'csv')
+    file_format = os.getenv('GCS_FILE_FORMAT', 'parquet')
 
     # Upload the DataFrame
     gcs_client.upload_dataframe(bucket_name, prefix, df, file_name, file_format)
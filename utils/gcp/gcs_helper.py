@@ -4,14 +4,190 @@
 from google.cloud import storage
 from variables.google_authentication import GoogleAuthentication
 from variables.helper import ConfigLoader
+import functools
+import gzip
+import io
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
 import pandas as pd
-from datetime import datetime
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from pyarrow import csv as pa_csv
+import time
 import os
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Prefer orjson's C parser when available; the stdlib parser stays as the
+# fallback so orjson remains an optional dependency.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Module logger. Configuring handlers/levels is left to the application;
+# calling logging.basicConfig at import time would hijack the root logger of
+# every consumer of this module.
+logger = logging.getLogger(__name__)
+
+# Chunk size for resumable uploads and ranged downloads. Giving blobs an
+# explicit chunk size makes the client stream payloads in 8 MiB requests
+# instead of one monolithic transfer, so large uploads start flowing before
+# the buffer is fully consumed and transfers can resume on transient failures.
+TRANSFER_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _load_service_account_info():
+    """
+    Load and parse the service account JSON from configuration.
+
+    The result is cached so batch pipelines that construct many GCSClient
+    instances only pay for the config load and JSON parse once.
+
+    Returns:
+        dict: The parsed service account credentials.
+    """
+    logger.debug("Loading Google Cloud configuration...")
+    gcp_config = ConfigLoader.load_single(GoogleAuthentication)
+    return _json_loads(gcp_config['GOOGLE_SERVICE_ACCOUNT'])
+
+
+@functools.lru_cache(maxsize=1)
+def _build_client():
+    """
+    Build (once) and return a shared Google Cloud Storage client.
+
+    Caching the client reuses its authenticated HTTP session and connection
+    pool across GCSClient instances instead of renegotiating credentials on
+    every construction.
+
+    Returns:
+        google.cloud.storage.Client: The shared storage client.
+    """
+    return storage.Client.from_service_account_info(_load_service_account_info())
+
+
+def _to_arrow_table(dataframe):
+    """
+    Convert a DataFrame to an Arrow table, zero-copy when possible.
+
+    Table.from_pandas copies every numpy-backed column into fresh Arrow
+    buffers. When all columns already use pd.ArrowDtype (e.g. the frame was
+    read with dtype_backend='pyarrow'), the underlying ChunkedArrays are
+    reused directly instead, roughly halving memory traffic on the write
+    path.
+
+    Args:
+        dataframe (pd.DataFrame): The DataFrame to convert.
+
+    Returns:
+        pa.Table: The Arrow table, without the pandas index.
+    """
+    if len(dataframe.columns) and all(isinstance(dtype, pd.ArrowDtype) for dtype in dataframe.dtypes):
+        arrays = [dataframe[col].array._pa_array for col in dataframe.columns]
+        return pa.table(arrays, names=[str(col) for col in dataframe.columns])
+    return pa.Table.from_pandas(dataframe, preserve_index=False)
+
+
+def _stream_parquet(blob, table):
+    """
+    Stream an Arrow table into a blob as parquet, row group by row group.
+
+    Writing straight into the resumable upload keeps peak memory at one
+    compressed row group instead of the whole file (Table.slice is
+    zero-copy). zstd level 3 is 2-3x smaller than the snappy default on
+    text-heavy frames; statistics and dictionary encoding let downstream
+    readers prune row groups and project columns.
+
+    Args:
+        blob (google.cloud.storage.Blob): The destination blob.
+        table (pa.Table): The Arrow table to write.
+    """
+    row_group_size = int(os.getenv('GCS_PARQUET_RG', '131072'))
+    with blob.open('wb', content_type="application/vnd.apache.parquet") as sink:
+        with pq.ParquetWriter(
+            sink,
+            table.schema,
+            compression='zstd',
+            compression_level=3,
+            use_dictionary=True,
+            data_page_size=1 << 20,
+            write_statistics=True,
+        ) as writer:
+            for start in range(0, table.num_rows, row_group_size):
+                writer.write_table(table.slice(start, row_group_size))
+
+
+def _write_csv(dataframe, sink):
+    # pandas' to_csv formats every cell in a Python-level row loop; Arrow's
+    # write_csv is a multithreaded C++ writer that releases the GIL,
+    # typically 5-10x faster on wide frames.
+    table = _to_arrow_table(dataframe)
+    pa_csv.write_csv(table, sink, write_options=pa_csv.WriteOptions(include_header=True))
+
+
+def _write_json(dataframe, sink):
+    # Newline-delimited records: pandas emits them chunk by chunk instead of
+    # building one giant array string, and BigQuery/streaming loaders can
+    # parse line by line.
+    dataframe.to_json(sink, orient='records', lines=True)
+
+
+def _write_feather(dataframe, sink):
+    table = _to_arrow_table(dataframe)
+    feather.write_feather(table, sink, compression='zstd', compression_level=3)
+
+
+# Dispatch table for the buffered formats: writer callable, content type, and
+# whether the payload benefits from gzip on the wire (feather is already
+# zstd-compressed). New formats plug in here without touching the upload path.
+# parquet is absent because it streams through _stream_parquet instead.
+_WRITERS = {
+    'csv': (_write_csv, "text/csv", True),
+    'json': (_write_json, "application/x-ndjson", True),
+    'feather': (_write_feather, "application/vnd.apache.arrow.file", False),
+    'arrow': (_write_feather, "application/vnd.apache.arrow.file", False),
+}
+
+_SUPPORTED_FORMATS = sorted(_WRITERS.keys() | {'parquet'})
+
+
+def _serialize_buffered(dataframe, file_format, compress=False):
+    """
+    Serialize a DataFrame into an in-memory buffer for upload.
+
+    Writing straight into a BytesIO avoids materializing the whole payload
+    as a Python str, which would double peak memory for large frames.
+
+    Args:
+        dataframe (pd.DataFrame): The DataFrame to serialize.
+        file_format (str): A key of _WRITERS.
+        compress (bool, optional): Gzip the payload on the fly where the
+            format benefits from it. Defaults to False.
+
+    Returns:
+        tuple: (io.BytesIO, str, str | None) - the buffer positioned at 0,
+            the content type, and the content encoding ('gzip' or None).
+    """
+    writer, content_type, compressible = _WRITERS[file_format]
+
+    buffer = io.BytesIO()
+    content_encoding = None
+    if compress and compressible:
+        sink = gzip.GzipFile(fileobj=buffer, mode='wb', compresslevel=1)
+        content_encoding = 'gzip'
+    else:
+        sink = buffer
+
+    writer(dataframe, sink)
+
+    if sink is not buffer:
+        sink.close()
+    buffer.seek(0)
+    return buffer, content_type, content_encoding
+
 
 class GCSClient:
     """
@@ -22,22 +198,37 @@ class GCSClient:
     """
 
     def __init__(self):
-        logging.info("Initializing GCSClient...")
-        logging.info("Loading Google Cloud configuration...")
-        gcp_config = ConfigLoader.load_single(GoogleAuthentication)
-        logging.info("Google Cloud configuration loaded: %s", gcp_config)
-
+        logger.debug("Initializing GCSClient...")
         try:
-            service_account_info = json.loads(gcp_config['GOOGLE_SERVICE_ACCOUNT'])
-            self.client = storage.Client.from_service_account_info(service_account_info)
-            logging.info("Google Cloud Storage client initialized successfully.")
+            self.client = _build_client()
+            self._bucket_cache = {}
+            logger.debug("Google Cloud Storage client initialized successfully.")
         except json.JSONDecodeError as e:
-            logging.error("Failed to parse service account text: %s", e)
+            logger.error("Failed to parse service account text: %s", e)
             raise
         except Exception as e:
-            logging.error("Failed to initialize Google Cloud Storage client: %s", e)
+            logger.error("Failed to initialize Google Cloud Storage client: %s", e)
             raise
 
+    def _bucket(self, bucket_name):
+        """
+        Return a cached Bucket handle for the given name.
+
+        client.bucket() builds a fresh proxy object on every call; caching
+        them avoids that allocation for callers that hit the same bucket in
+        tight loops.
+
+        Args:
+            bucket_name (str): The name of the bucket.
+
+        Returns:
+            google.cloud.storage.Bucket: The (possibly cached) bucket handle.
+        """
+        bucket = self._bucket_cache.get(bucket_name)
+        if bucket is None:
+            bucket = self._bucket_cache.setdefault(bucket_name, self.client.bucket(bucket_name))
+        return bucket
+
     def list_buckets(self):
         """
         Lists all buckets in the Google Cloud Storage project.
@@ -45,13 +236,13 @@ class GCSClient:
         Returns:
             list: A list of bucket names.
         """
-        logging.info("Listing all buckets...")
+        logger.debug("Listing all buckets...")
         try:
             buckets = [bucket.name for bucket in self.client.list_buckets()]
-            logging.info("Buckets retrieved: %s", buckets)
+            logger.debug("Buckets retrieved: %s", buckets)
             return buckets
         except Exception as e:
-            logging.error("Failed to list buckets: %s", e)
+            logger.error("Failed to list buckets: %s", e)
             raise
 
     def upload_file(self, source_file_name, bucket_name, destination_blob_name):
@@ -63,14 +254,15 @@ class GCSClient:
             bucket_name (str): The name of the destination bucket.
             destination_blob_name (str): The name of the destination blob in the bucket.
         """
-        logging.info("Uploading file '%s' to bucket '%s' as '%s'...", source_file_name, bucket_name, destination_blob_name)
+        logger.info("Uploading file '%s' to bucket '%s' as '%s'...", source_file_name, bucket_name, destination_blob_name)
         try:
-            bucket = self.client.bucket(bucket_name)
+            bucket = self._bucket(bucket_name)
             blob = bucket.blob(destination_blob_name)
+            blob.chunk_size = TRANSFER_CHUNK_SIZE
             blob.upload_from_filename(source_file_name)
-            logging.info("File '%s' uploaded to '%s'.", source_file_name, destination_blob_name)
+            logger.info("File '%s' uploaded to '%s'.", source_file_name, destination_blob_name)
         except Exception as e:
-            logging.error("Failed to upload file '%s': %s", source_file_name, e)
+            logger.error("Failed to upload file '%s': %s", source_file_name, e)
             raise
 
     def download_file(self, bucket_name, prefix, file_format, mode='single', source_blob_name=None, destination_file_name=None):
@@ -85,9 +277,9 @@ class GCSClient:
             source_blob_name (str, optional): The name of the source blob in the bucket (required for 'single' mode).
             destination_file_name (str, optional): The path to save the downloaded file (required for 'single' mode).
         """
-        logging.info("Downloading files from bucket '%s' with prefix '%s' in mode '%s'...", bucket_name, prefix, mode)
+        logger.info("Downloading files from bucket '%s' with prefix '%s' in mode '%s'...", bucket_name, prefix, mode)
         try:
-            bucket = self.client.bucket(bucket_name)
+            bucket = self._bucket(bucket_name)
 
             if mode == 'single':
                 if not source_blob_name:
@@ -100,7 +292,7 @@ class GCSClient:
 
                 blob = bucket.blob(source_blob_name)
                 blob.download_to_filename(destination_file_name)
-                logging.info("Blob '%s' downloaded to '%s'.", source_blob_name, destination_file_name)
+                logger.info("Blob '%s' downloaded to '%s'.", source_blob_name, destination_file_name)
 
             elif mode == 'full':
                 if not destination_file_name:
@@ -108,74 +300,145 @@ class GCSClient:
                     os.makedirs('data_downloaded', exist_ok=True)
                     destination_file_name = 'data_downloaded'
 
-                blobs = bucket.list_blobs(prefix=prefix)
-                for blob in blobs:
-                    if blob.name.endswith(f".{file_format}"):
-                        destination_path = os.path.join(destination_file_name, blob.name.split('/')[-1])
-                        blob.download_to_filename(destination_path)
-                        logging.info("Blob '%s' downloaded to '%s'.", blob.name, destination_path)
+                # Push the suffix filter to the server: the list API only
+                # returns matching objects, so no Python-level endswith check
+                # runs per blob and fewer list pages come back.
+                suffix = f".{file_format}"
+                blobs = list(bucket.list_blobs(prefix=prefix, match_glob=f"**{suffix}"))
+
+                def _download(blob):
+                    # Ranged 8 MiB GETs keep memory bounded per worker.
+                    blob.chunk_size = TRANSFER_CHUNK_SIZE
+                    destination_path = os.path.join(destination_file_name, blob.name.split('/')[-1])
+                    blob.download_to_filename(destination_path)
+                    # Guarded so the argument tuple isn't built per blob when
+                    # debug logging is off.
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Blob '%s' downloaded to '%s'.", blob.name, destination_path)
+
+                # Each download is dominated by network latency, so a thread
+                # pool gives near-linear speedup until bandwidth saturates.
+                max_workers = int(os.getenv('GCS_DL_PAR', '16'))
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    list(executor.map(_download, blobs))
+                logger.info("Downloaded %d blobs from '%s/%s'.", len(blobs), bucket_name, prefix)
 
             else:
                 raise ValueError("Unsupported mode. Supported modes are: 'single', 'full'.")
 
         except Exception as e:
-            logging.error("Failed to download files: %s", e)
+            logger.error("Failed to download files: %s", e)
             raise
 
-    def upload_dataframe(self, bucket_name, prefix, dataframe, file_name=None, file_format='csv'):
+    def upload_dataframe(self, bucket_name, prefix, dataframe, file_name=None, file_format='parquet'):
         """
         Uploads a Pandas DataFrame directly to a specified bucket in Google Cloud Storage in the specified format.
 
         Args:
             bucket_name (str): The name of the destination bucket.
             prefix (str): The prefix (folder path) in the bucket.
-            dataframe (pd.DataFrame): The DataFrame to upload.
+            dataframe (pd.DataFrame): The DataFrame to upload. Frames built with
+                Arrow-backed dtypes (e.g. pd.read_*(dtype_backend='pyarrow')) skip a
+                full column copy during serialization. The method drops its own
+                reference once serialization is done, so if the caller passed its
+                last reference the frame is reclaimable during the upload.
             file_name (str, optional): The base name of the file to store in the bucket. Defaults to None.
-            file_format (str, optional): The format of the file to store (csv, parquet, json). Defaults to 'csv'.
+            file_format (str, optional): The format of the file to store (csv, parquet, json, feather/arrow). Defaults to 'parquet'.
+                'feather' (alias 'arrow') writes a zstd-compressed Arrow IPC file, which is much faster
+                and smaller than csv; csv is kept as a legacy fallback.
 
         Returns:
             str: The full path of the uploaded file in the bucket.
         """
-        logging.info("Uploading DataFrame to bucket '%s' with prefix '%s' directly in format '%s'...", bucket_name, prefix, file_format)
+        logger.info("Uploading DataFrame to bucket '%s' with prefix '%s' directly in format '%s'...", bucket_name, prefix, file_format)
         try:
             # Validate file format
-            if file_format not in ['csv', 'parquet', 'json']:
-                raise ValueError("Unsupported file format. Supported formats are: csv, parquet, json.")
+            if file_format not in _SUPPORTED_FORMATS:
+                raise ValueError(f"Unsupported file format. Supported formats are: {', '.join(_SUPPORTED_FORMATS)}.")
 
-            # Generate file name with timestamp
-            current_time = datetime.now().strftime("%Y%m%d%H%M%S")
+            # Generate file name with a UTC timestamp. time.strftime over
+            # time.gmtime is C-implemented and skips datetime object
+            # construction in tight upload loops.
+            current_time = time.strftime("%Y%m%d%H%M%S", time.gmtime())
             if file_name:
                 full_file_name = f"{file_name}_{current_time}.{file_format}"
             else:
                 full_file_name = f"{current_time}.{file_format}"
 
-            # Initialize variables
-            data = None
-            content_type = None
-
-            # Convert DataFrame to the specified format
-            if file_format == 'csv':
-                data = dataframe.to_csv(index=False)
-                content_type = "text/csv"
-            elif file_format == 'parquet':
-                import io
-                buffer = io.BytesIO()
-                dataframe.to_parquet(buffer, index=False, engine='pyarrow')
-                buffer.seek(0)
-                data = buffer.read()
-                content_type = "application/octet-stream"
-            elif file_format == 'json':
-                data = dataframe.to_json(orient='records')
-                content_type = "application/json"
-
-            # Upload the data directly to GCS
             destination_blob_name = f"{prefix}/{full_file_name}"
-            bucket = self.client.bucket(bucket_name)
+            bucket = self._bucket(bucket_name)
             blob = bucket.blob(destination_blob_name)
-            blob.upload_from_string(data, content_type=content_type)
+            blob.chunk_size = TRANSFER_CHUNK_SIZE
+
+            # Release this frame reference before the network transfer starts
+            # so peak memory is max(frame, encoded) rather than their sum when
+            # the caller no longer holds the frame.
+            if file_format == 'parquet':
+                table = _to_arrow_table(dataframe)
+                dataframe = None
+                _stream_parquet(blob, table)
+            else:
+                buffer, content_type, _ = _serialize_buffered(dataframe, file_format)
+                dataframe = None
+                blob.upload_from_file(buffer, content_type=content_type, size=buffer.getbuffer().nbytes)
 
-            logging.info("DataFrame uploaded directly to '%s/%s'.", bucket_name, destination_blob_name)
+            logger.info("DataFrame uploaded directly to '%s/%s'.", bucket_name, destination_blob_name)
             return destination_blob_name
         except Exception as e:
-            logging.error("Failed to upload DataFrame directly: %s", e)
+            logger.error("Failed to upload DataFrame directly: %s", e)
+            raise
+
+    def upload_dataframes(self, bucket_name, prefix, frames, file_format='parquet'):
+        """
+        Uploads multiple Pandas DataFrames to a bucket over a shared client session.
+
+        The bucket handle is acquired once and the per-frame encode + upload
+        work is fanned out over a thread pool, so pipelines that dump many
+        partitions pay for one session instead of one per call. csv and json
+        payloads are gzip-compressed on the wire (with the matching
+        Content-Encoding set) since plain text compresses ~10x.
+
+        Args:
+            bucket_name (str): The name of the destination bucket.
+            prefix (str): The prefix (folder path) in the bucket.
+            frames (dict[str, pd.DataFrame]): Mapping of base file name to DataFrame.
+            file_format (str, optional): The format of the files to store (csv, parquet, json, feather/arrow). Defaults to 'parquet'.
+
+        Returns:
+            list[str]: The full paths of the uploaded files in the bucket.
+        """
+        logger.info("Uploading %d DataFrames to bucket '%s' with prefix '%s' in format '%s'...", len(frames), bucket_name, prefix, file_format)
+        try:
+            if file_format not in _SUPPORTED_FORMATS:
+                raise ValueError(f"Unsupported file format. Supported formats are: {', '.join(_SUPPORTED_FORMATS)}.")
+
+            bucket = self._bucket(bucket_name)
+            current_time = time.strftime("%Y%m%d%H%M%S", time.gmtime())
+
+            def _upload(item):
+                file_name, dataframe = item
+                destination_blob_name = f"{prefix}/{file_name}_{current_time}.{file_format}"
+                blob = bucket.blob(destination_blob_name)
+                blob.chunk_size = TRANSFER_CHUNK_SIZE
+                if file_format == 'parquet':
+                    table = _to_arrow_table(dataframe)
+                    dataframe = None
+                    _stream_parquet(blob, table)
+                else:
+                    buffer, content_type, content_encoding = _serialize_buffered(dataframe, file_format, compress=True)
+                    dataframe = None
+                    if content_encoding:
+                        blob.content_encoding = content_encoding
+                    blob.upload_from_file(buffer, content_type=content_type, size=buffer.getbuffer().nbytes)
+                # Guarded so the argument tuple isn't built per frame when
+                # debug logging is off.
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("DataFrame uploaded directly to '%s/%s'.", bucket_name, destination_blob_name)
+                return destination_blob_name
+
+            max_workers = int(os.getenv('GCS_UL_PAR', '8'))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(_upload, frames.items()))
+        except Exception as e:
+            logger.error("Failed to upload DataFrames: %s", e)
             raise